@@ -3,17 +3,39 @@
 Содержит универсальные методы работы с элементами и явные ожидания.
 """
 
-from typing import Tuple, Callable, Any, List
+from contextlib import contextmanager
+from typing import Tuple, Callable, Any, List, Dict, Iterator
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import (
+    TimeoutException,
+    StaleElementReferenceException,
+    NoSuchElementException,
+)
 from selenium.webdriver.common.by import By
 import allure
 from config import Config
 
 
+@contextmanager
+def no_implicit_wait(driver: WebDriver) -> Iterator[WebDriver]:
+    """
+    Временное отключение неявного ожидания, чтобы find_elements при отсутствии
+    элемента сразу возвращал пустой список. После выхода восстанавливается
+    Config.IMPLICIT_WAIT — значение, которое устанавливает BasePage; текущее значение
+    у драйвера не запрашивается, чтобы не тратить на это лишний запрос.
+
+    :param driver: экземпляр веб-драйвера
+    """
+    driver.implicitly_wait(0)
+    try:
+        yield driver
+    finally:
+        driver.implicitly_wait(Config.IMPLICIT_WAIT)
+
+
 class BasePage:
     """
     Базовый класс, от которого наследуются все Page Object.
@@ -27,25 +49,50 @@ class BasePage:
         :param driver: экземпляр веб-драйвера
         """
         self.driver = driver
+        self.driver.implicitly_wait(Config.IMPLICIT_WAIT)
         self.wait = WebDriverWait(driver, Config.EXPLICIT_WAIT)
+        self._elem_cache: Dict[Tuple[By, str], WebElement] = {}
+
+    def clear_element_cache(self) -> None:
+        """Сброс кэша найденных элементов (после перехода на другую страницу)."""
+        self._elem_cache.clear()
 
     @allure.step("Ожидание появления элемента {locator}")
     def find_element(self, locator: Tuple[By, str]) -> WebElement:
         """
+        Поиск элемента с неявным ожиданием: повторные попытки выполняет сам браузер,
+        поэтому найденный элемент возвращается за один запрос к драйверу.
+        Ожидание длится Config.IMPLICIT_WAIT секунд.
         
         :param locator: локатор элемента (By, value)
         :return: WebElement
+        :raises TimeoutException: если элемент не появился за время ожидания
         """
-        return self.wait.until(EC.presence_of_element_located(locator))
+        try:
+            element = self.driver.find_element(*locator)
+        except NoSuchElementException as exc:
+            raise TimeoutException(f"Элемент {locator} не найден") from exc
+        self._elem_cache[locator] = element
+        return element
 
     @allure.step("Ожидание кликабельности элемента {locator}")
     def find_clickable(self, locator: Tuple[By, str]) -> WebElement:
         """
-        Явное ожидание кликабельности элемента.
+        Явное ожидание кликабельности элемента. Если элемент уже был найден
+        через find_element и кликабелен прямо сейчас, повторный поиск по локатору
+        не выполняется; иначе ожидание идёт по локатору.
         
         :param locator: локатор элемента
         :return: WebElement
         """
+        cached = self._elem_cache.pop(locator, None)
+        if cached is not None:
+            try:
+                if cached.is_displayed() and cached.is_enabled():
+                    self._elem_cache[locator] = cached
+                    return cached
+            except StaleElementReferenceException:
+                pass
         return self.wait.until(EC.element_to_be_clickable(locator))
 
     @allure.step("Клик по элементу {locator}")
@@ -69,6 +116,27 @@ class BasePage:
         element.clear()
         element.send_keys(text)
 
+    @allure.step("Установка значения '{text}' в поле {locator}")
+    def set_react_value(self, locator: Tuple[By, str], text: str) -> None:
+        """
+        Установка значения поля одним вызовом JavaScript с генерацией события input.
+        Поле предварительно получает фокус, как при обычном вводе с клавиатуры.
+        Используется нативный сеттер value, чтобы React увидел изменение и выполнил
+        одну перерисовку вместо посимвольного ввода через send_keys.
+
+        :param locator: локатор поля ввода
+        :param text: устанавливаемое значение
+        """
+        element = self.find_element(locator)
+        self.driver.execute_script(
+            "arguments[0].focus();"
+            "const setter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set;"
+            "setter.call(arguments[0], arguments[1]);"
+            "arguments[0].dispatchEvent(new Event('input', {bubbles: true}));",
+            element,
+            text,
+        )
+
     @allure.step("Получение текста элемента {locator}")
     def get_text(self, locator: Tuple[By, str]) -> str:
         """
@@ -79,27 +147,128 @@ class BasePage:
         """
         return self.find_element(locator).text
 
+    @allure.step("Получение текста всех элементов {locator}")
+    def get_texts(self, locator: Tuple[By, str]) -> List[str]:
+        """
+        Получение видимого текста всех найденных элементов одним вызовом JavaScript
+        вместо отдельного запроса к драйверу на каждый element.text.
+        Пробелы по краям обрезаются, пустые строки отбрасываются.
+        Метод не ждёт появления элементов (для любого типа локатора): если их ещё нет,
+        возвращается пустой список, поэтому перед вызовом дождитесь элементов
+        (например, через is_element_present) или используйте wait_and_collect_texts.
+
+        :param locator: локатор элементов
+        :return: список непустых текстов элементов в порядке следования в документе
+        """
+        by, value = locator
+        if by == By.CSS_SELECTOR:
+            return self.driver.execute_script(
+                "return Array.from(document.querySelectorAll(arguments[0]))"
+                ".map(e => e.innerText.trim()).filter(Boolean);",
+                value,
+            )
+        with no_implicit_wait(self.driver):
+            elements = self.driver.find_elements(*locator)
+        return self.driver.execute_script(
+            "return arguments[0].map(e => e.innerText.trim()).filter(Boolean);", elements
+        )
+
     @allure.step("Проверка наличия элемента {locator}")
     def is_element_present(self, locator: Tuple[By, str], timeout: int = 5) -> bool:
-        """       
+        """
+        Проверка наличия элемента. При timeout=0 выполняется один запрос find_elements
+        без ожидания.
+
         :param locator: локатор элемента
         :param timeout: время ожидания в секундах
         :return: True если элемент присутствует, иначе False
         """
-        try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(locator)
-            )
-            return True
-        except TimeoutException:
-            return False
+        with no_implicit_wait(self.driver):
+            if timeout == 0:
+                return bool(self.driver.find_elements(*locator))
+            try:
+                WebDriverWait(self.driver, timeout).until(
+                    EC.presence_of_all_elements_located(locator)
+                )
+                return True
+            except TimeoutException:
+                return False
+
+    @allure.step("Проверка кликабельности элемента {locator}")
+    def is_clickable(self, locator: Tuple[By, str], timeout: float = 0.5, poll: float = 0.1) -> bool:
+        """
+        Короткая проверка кликабельности элемента (например, активна ли кнопка).
+        Ожидание ограничено timeout, неявное ожидание на время проверки отключается.
+
+        :param locator: локатор элемента
+        :param timeout: время ожидания в секундах
+        :param poll: интервал опроса в секундах
+        :return: True если элемент кликабелен, иначе False
+        """
+        with no_implicit_wait(self.driver):
+            try:
+                WebDriverWait(self.driver, timeout, poll_frequency=poll).until(
+                    EC.element_to_be_clickable(locator)
+                )
+                return True
+            except TimeoutException:
+                return False
+
+    @allure.step("Проверка отсутствия элемента {locator}")
+    def is_element_absent(self, locator: Tuple[By, str], timeout: int = 5) -> bool:
+        """
+        Ожидание, пока на странице не останется ни одного элемента по локатору.
+
+        :param locator: локатор элемента
+        :param timeout: время ожидания в секундах
+        :return: True если элемент отсутствует, иначе False
+        """
+        with no_implicit_wait(self.driver):
+            try:
+                WebDriverWait(self.driver, timeout).until(
+                    lambda driver: not driver.find_elements(*locator)
+                )
+                return True
+            except TimeoutException:
+                return False
+
+    @allure.step("Ожидание и получение текста элементов {locator}")
+    def wait_and_collect_texts(self, locator: Tuple[By, str], timeout: int = 5) -> List[str]:
+        """
+        Ожидание появления элементов и получение их текста одним асинхронным скриптом:
+        MutationObserver ждёт первого совпадения, затем возвращаются тексты всех элементов.
+        Для локаторов не-CSS выполняется is_element_present и get_texts.
+
+        :param locator: локатор элементов
+        :param timeout: время ожидания в секундах
+        :return: список непустых текстов элементов (пустой, если элементы не появились)
+        """
+        by, selector = locator
+        if by != By.CSS_SELECTOR:
+            return self.get_texts(locator) if self.is_element_present(locator, timeout) else []
+        return self.driver.execute_async_script(
+            "const [selector, timeout, done] = arguments;"
+            "const collect = () => Array.from(document.querySelectorAll(selector))"
+            ".map(e => e.innerText.trim()).filter(Boolean);"
+            "if (document.querySelector(selector)) return done(collect());"
+            "const observer = new MutationObserver(() => {"
+            "if (document.querySelector(selector)) { observer.disconnect(); done(collect()); }"
+            "});"
+            "observer.observe(document, {subtree: true, childList: true});"
+            "setTimeout(() => { observer.disconnect(); done([]); }, timeout);",
+            selector,
+            int(timeout * 1000),
+        )
 
     @allure.step("Ожидание выполнения пользовательского условия")
-    def wait_for_result(self, condition: Callable[[], Any], timeout: int = 10) -> Any:
+    def wait_for_result(self, condition: Callable[[], Any], timeout: int = 10, poll: float = 0.1) -> Any:
         """
-        
+        Ожидание выполнения условия на стороне Python. Условие должно быть дешёвым
+        (без обращений к WebDriver), иначе частый опрос создаёт лишние запросы к драйверу.
+
         :param condition: функция-условие, возвращающая не ложное значение
         :param timeout: максимальное время ожидания в секундах
+        :param poll: интервал опроса в секундах
         :return: результат выполнения condition (первое не ложное значение)
         """
-        return WebDriverWait(self.driver, timeout).until(lambda _: condition())
+        return WebDriverWait(self.driver, timeout, poll_frequency=poll).until(lambda _: condition())
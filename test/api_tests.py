@@ -1,6 +1,6 @@
 import allure
 import pytest
-from datetime import datetime, timedelta
+from types import SimpleNamespace
 from api_tests.clients.suggest_client import SuggestApiClient
 from api_tests.clients.flight_client import FlightSearchApiClient
 
@@ -54,9 +54,9 @@ class TestAviasalesAPI:
 
     @allure.title("Поиск билетов с прошедшей датой")
     @allure.description("При указании даты вылета в прошлом API должно вернуть ошибку или пустой результат")
-    def test_flight_search_past_date(self, flight_client: FlightSearchApiClient) -> None:
+    def test_flight_search_past_date(self, flight_client: FlightSearchApiClient, dates: SimpleNamespace) -> None:
         """Тест поиска билетов с прошедшей датой."""
-        past_date = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+        past_date = dates.week_ago
 
         with allure.step(f"Отправить запрос с датой {past_date}"):
             try:
@@ -0,0 +1,113 @@
+import os
+import pytest
+from datetime import date, timedelta
+from types import SimpleNamespace
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.driver_cache import DriverCacheManager
+from main_page import MainPage
+from api_tests.clients.suggest_client import SuggestApiClient
+from api_tests.clients.flight_client import FlightSearchApiClient
+
+
+# Сколько дней скачанный chromedriver хранится в кэше, прежде чем будет скачан заново.
+# Проверка нужной версии по сети всё равно выполняется при каждом install().
+DRIVER_CACHE_VALID_DAYS = 365
+
+# Запуск браузера без окна (для CI): HEADLESS=1 / true / yes
+HEADLESS = os.getenv("HEADLESS", "").lower() in ("1", "true", "yes")
+
+# Сторонние счётчики и реклама, которые не нужны тестам и замедляют загрузку страницы
+BLOCKED_URLS = [
+    "*google-analytics*",
+    "*googletagmanager*",
+    "*mc.yandex.ru*",
+    "*criteo*",
+    "*doubleclick*",
+    "*facebook.net*",
+]
+
+
+@pytest.fixture(scope="session")
+def chrome_driver_path() -> str:
+    """
+    Фикстура, возвращающая путь к chromedriver.
+    install() (с сетевым запросом версии) выполняется один раз на сессию,
+    сам бинарник берётся из локального кэша webdriver-manager.
+    """
+    cache_manager = DriverCacheManager(valid_range=DRIVER_CACHE_VALID_DAYS)
+    return ChromeDriverManager(cache_manager=cache_manager).install()
+
+
+@pytest.fixture(scope="session")
+def driver(chrome_driver_path, tmp_path_factory):
+    """
+    Фикстура, создающая экземпляр веб-драйвера Chrome.
+    Браузер запускается один раз на сессию и закрывается после всех тестов.
+    """
+    options = webdriver.ChromeOptions()
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    # Чистый профиль для каждого запуска и воркера pytest-xdist, чтобы браузеры не блокировали друг друга
+    worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+    options.add_argument(f"--user-data-dir={tmp_path_factory.mktemp(f'chrome-{worker}')}")
+    options.page_load_strategy = "eager"
+    # Тесты не проверяют изображения и уведомления — не загружаем их
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    })
+    # Размер окна задаётся при запуске, чтобы первая отрисовка страницы шла сразу в итоговом размере
+    options.add_argument("--window-size=1920,1080")
+    if HEADLESS:
+        options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+    service = Service(chrome_driver_path)
+    driver = webdriver.Chrome(service=service, options=options)
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+    yield driver
+    driver.quit()
+
+
+@pytest.fixture
+def main_page(driver) -> MainPage:
+    """
+    Фикстура, возвращающая экземпляр главной страницы (уже открытой).
+    Перед каждым тестом очищает cookies и заново открывает страницу, чтобы состояние
+    формы (поля, выбранная дата, открытые меню) не переходило из теста в тест.
+    """
+    driver.delete_all_cookies()
+    page = MainPage(driver)
+    page.open()
+    return page
+
+
+@pytest.fixture(scope="session")
+def suggest_client() -> SuggestApiClient:
+    """Фикстура клиента автодополнения (одна на сессию, соединения переиспользуются)."""
+    return SuggestApiClient()
+
+
+@pytest.fixture(scope="session")
+def flight_client() -> FlightSearchApiClient:
+    """Фикстура клиента поиска билетов (требуется токен, одна на сессию)."""
+    return FlightSearchApiClient()
+
+
+@pytest.fixture(scope="session")
+def dates() -> SimpleNamespace:
+    """
+    Фикстура с датами в формате YYYY-MM-DD, вычисленными один раз на сессию
+    от одного значения «сегодня», чтобы тесты не расходились на границе суток.
+    Содержит поля yesterday, tomorrow и week_ago.
+    """
+    today = date.today()
+    return SimpleNamespace(
+        yesterday=(today - timedelta(days=1)).isoformat(),
+        tomorrow=(today + timedelta(days=1)).isoformat(),
+        week_ago=(today - timedelta(days=7)).isoformat(),
+    )
@@ -1,9 +1,15 @@
+import re
 import allure
 import pytest
-from datetime import datetime, timedelta
+from types import SimpleNamespace
 from selenium.webdriver.support import expected_conditions as EC
 from main_page import MainPage
 
+# Признаки аэропортов Москвы в тексте подсказки
+MOSCOW_AIRPORTS_RE = re.compile(r"Москва|SVO|VKO|DME|ZIA")
+# Символ валюты в строке цены
+CURRENCY_RE = re.compile(r"[₽$€]")
+
 
 @allure.feature("UI Aviasales")
 @allure.story("Поиск авиабилетов")
@@ -16,30 +22,26 @@ class TestAviasalesUI:
     def test_moscow_airport_suggestions(self, main_page: MainPage) -> None:
         """Проверка, что выпадающий список содержит аэропорты Москвы."""
         with allure.step("Ввести 'Москва' в поле отправления"):
-            main_page.send_keys(main_page.ORIGIN_INPUT, "Москва")
+            main_page.set_react_value(main_page.ORIGIN_INPUT, "Москва")
 
         with allure.step("Дождаться появления подсказок"):
-            main_page.wait.until(EC.presence_of_element_located(main_page.SUGGESTION_ITEM))
-
-        suggestions = main_page.get_suggest_items_text()
+            suggestions = main_page.wait_and_collect_texts(main_page.SUGGESTION_ITEM)
 
         with allure.step("Проверить наличие аэропортов Москвы в подсказках"):
-            assert any(
-                "Москва" in s or "SVO" in s or "VKO" in s or "DME" in s or "ZIA" in s
-                for s in suggestions
-            ), f"Не найдены аэропорты Москвы: {suggestions}"
+            assert any(MOSCOW_AIRPORTS_RE.search(s) for s in suggestions), \
+                f"Не найдены аэропорты Москвы: {suggestions}"
 
     @allure.title("Календарь: блокировка прошедших дат")
     @allure.description("Прошедшие даты в календаре должны быть неактивны (disabled)")
-    def test_past_dates_disabled(self, main_page: MainPage) -> None:
+    def test_past_dates_disabled(self, main_page: MainPage, dates: SimpleNamespace) -> None:
         """Проверка, что вчерашняя дата недоступна для выбора."""
-        yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+        yesterday = dates.yesterday
         with allure.step(f"Проверить, что дата {yesterday} недоступна"):
             assert main_page.is_date_disabled(yesterday), f"Прошедшая дата {yesterday} доступна для выбора"
 
     @allure.title("Кнопка 'Найти билеты' активируется после заполнения обязательных полей")
     @allure.description("Кнопка поиска должна быть неактивна, пока не заполнены Откуда, Куда и Дата")
-    def test_search_button_enabled_after_filling(self, main_page: MainPage) -> None:
+    def test_search_button_enabled_after_filling(self, main_page: MainPage, dates: SimpleNamespace) -> None:
         """Проверка активации кнопки поиска после заполнения полей."""
         with allure.step("Проверить, что изначально кнопка неактивна"):
             assert not main_page.is_search_button_enabled(), "Кнопка активна без заполнения полей"
@@ -50,7 +52,7 @@ class TestAviasalesUI:
         with allure.step("Заполнить город назначения"):
             main_page.set_destination("Санкт-Петербург")
 
-        tomorrow = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+        tomorrow = dates.tomorrow
         with allure.step("Выбрать дату вылета (завтра)"):
             main_page.set_departure_date(tomorrow)
 
@@ -81,6 +83,6 @@ class TestAviasalesUI:
 
         prices = main_page.get_cheap_tickets_prices()
         with allure.step("Проверить, что цены отображаются"):
-            assert len(prices) > 0, "Список цен пуст"
-            assert all("₽" in p or "$" in p or "€" in p for p in prices), \
+            assert prices, "Список цен пуст"
+            assert all(CURRENCY_RE.search(p) for p in prices), \
                 f"Не все элементы содержат цену: {prices}"